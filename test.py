@@ -1,4 +1,6 @@
+import asyncio
 import os
+import threading
 from agents import Agent, Runner
 from dotenv import load_dotenv  
 load_dotenv()
@@ -8,8 +10,9 @@ weather_agent = Agent(
     name="Weather Agent",
     instructions=(
         "You are a weather expert. Provide fake weather updates. "
-        "If the user asks about stocks, movies, or general chat, "
-        "handoff control back to the Orchestrator."
+        "If the user asks about stocks, handoff to the Stock Agent. "
+        "If the user asks about movies, handoff to the Movie Agent. "
+        "For general chat, handoff to the Conversation Agent."
     )
 )
 
@@ -17,8 +20,9 @@ stock_agent = Agent(
     name="Stock Agent",
     instructions=(
         "You are a stock market analyst. Provide fake stock prices. "
-        "If the user asks about weather, movies, or chat, "
-        "handoff control back to the Orchestrator."
+        "If the user asks about weather, handoff to the Weather Agent. "
+        "If the user asks about movies, handoff to the Movie Agent. "
+        "For general chat, handoff to the Conversation Agent."
     )
 )
 
@@ -26,7 +30,9 @@ movie_agent = Agent(
     name="Movie Agent",
     instructions=(
         "You are a movie critic. Recommend movies. "
-        "If the user asks about other topics, handoff to the Orchestrator."
+        "If the user asks about weather, handoff to the Weather Agent. "
+        "If the user asks about stocks, handoff to the Stock Agent. "
+        "For general chat, handoff to the Conversation Agent."
     )
 )
 
@@ -34,8 +40,9 @@ chat_agent = Agent(
     name="Conversation Agent",
     instructions=(
         "You are a friendly assistant for small talk. "
-        "If the user asks for specific data (weather, stock, movies), "
-        "handoff to the Orchestrator."
+        "If the user asks about weather, handoff to the Weather Agent. "
+        "If the user asks about stocks, handoff to the Stock Agent. "
+        "If the user asks about movies, handoff to the Movie Agent."
     )
 )
 
@@ -50,30 +57,64 @@ orchestrator = Agent(
 )
 
 
-weather_agent.handoffs = [orchestrator]
-stock_agent.handoffs = [orchestrator]
-movie_agent.handoffs = [orchestrator]
-chat_agent.handoffs = [orchestrator]
+# Specialists hand off directly to each other; the Orchestrator is only
+# the entry point for the first turn.
+weather_agent.handoffs = [stock_agent, movie_agent, chat_agent]
+stock_agent.handoffs = [weather_agent, movie_agent, chat_agent]
+movie_agent.handoffs = [weather_agent, stock_agent, chat_agent]
+chat_agent.handoffs = [weather_agent, stock_agent, movie_agent]
 
 
-def main():
+async def prompt(text):
+    # Read stdin on a daemon thread: Ctrl-C cancels the await right away,
+    # and interpreter shutdown never waits on a thread stuck in input()
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def resolve(setter, value):
+        if not future.done():
+            setter(value)
+
+    def read():
+        try:
+            line = input(text)
+        except Exception as exc:
+            loop.call_soon_threadsafe(resolve, future.set_exception, exc)
+        else:
+            loop.call_soon_threadsafe(resolve, future.set_result, line)
+
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+
+async def main():
     print("Try asking about weather, then switch to stocks immediately.")
     
     current_agent = orchestrator
+    previous_response_id = None
     
     while True:
-        user_input = input("\nUser: ")
+        user_input = await prompt("\nUser: ")
         if user_input.lower() in ["exit", "quit"]:
             break
         
         
-        result = Runner.run_sync(
+        result = await Runner.run(
             starting_agent=current_agent,
-            input=user_input
+            input=user_input,
+            previous_response_id=previous_response_id
         )
         
         print(f"{result.final_output}")
         
+        # Resume the next turn at whichever agent answered this one, and
+        # chain off its response so the backend reuses the prior context.
+        # This keeps the whole conversation as server-side context, so
+        # token use grows each turn; only the default Responses API model
+        # honours previous_response_id (Chat Completions models ignore it)
+        current_agent = result.last_agent
+        previous_response_id = result.last_response_id
+        
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
@@ -4,9 +4,15 @@ async def replace_all_developers(r_session, dev_content):
     # 1. Fetch all current messages for this specific session
     items = await r_session.get_items() #
     
-    # 2. Separate messages to identify latest entries
-    user_msgs = [m for m in items if m.get("role") == "user"]
-    other_msgs = [m for m in items if m.get("role") not in ["user", "developer"]]
+    # 2. Separate messages to identify latest entries (single pass over items)
+    user_msgs = []
+    other_msgs = []
+    for m in items:
+        role = m.get("role")
+        if role == "user":
+            user_msgs.append(m)
+        elif role != "developer":
+            other_msgs.append(m)
     
     cleaned_user_history = []
     
@@ -15,6 +21,9 @@ async def replace_all_developers(r_session, dev_content):
         if i == len(user_msgs) - 1:
             # Keep the LATEST user message fully intact
             cleaned_user_history.append(msg)
+        elif not (isinstance(msg.get("content"), str) and '"grade_details"' in msg["content"]):
+            # Nothing to scrub: skip the JSON round-trip entirely
+            cleaned_user_history.append(msg)
         else:
             # For OLDER user messages, remove 'grade_details' from the JSON content
             try:
@@ -37,13 +46,11 @@ async def replace_all_developers(r_session, dev_content):
     await r_session.redis_client.delete(session_key)
 
     # 5. ADD FRESH CONTENT BACK
-    # Add back non-user/non-developer roles (Assistant, Tools, etc.)
-    if other_msgs:
-        await r_session.add_items(other_msgs)
-    
-    # Add back the cleaned/filtered user history
-    if cleaned_user_history:
-        await r_session.add_items(cleaned_user_history)
-    
-    # Finally, add the single "fresh" developer message
-    await r_session.add_items([{"role": "developer", "content": dev_content}])
+    # Non-user/non-developer roles (Assistant, Tools, etc.), then the
+    # cleaned/filtered user history, then the single "fresh" developer
+    # message -- written in one add_items call (one Redis round-trip)
+    await r_session.add_items(
+        other_msgs
+        + cleaned_user_history
+        + [{"role": "developer", "content": dev_content}]
+    )